@@ -0,0 +1,24 @@
+"""Concurrency limits for outbound calls to the backend services."""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class Backpressure:
+    """Caps the number of in-flight calls, overall and per backend service.
+
+    A call first waits for a slot on its own service and only then for a
+    global slot, so callers queued behind one slow service do not hold
+    global slots that calls to the other services could use.
+    """
+
+    def __init__(self, max_in_flight: int, max_in_flight_per_service: int, services: Iterable[str]) -> None:
+        self._total = asyncio.Semaphore(max_in_flight)
+        self._services = {service: asyncio.Semaphore(max_in_flight_per_service) for service in services}
+
+    async def run(self, service: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call`` once a slot is free for ``service``."""
+        async with self._services[service], self._total:
+            return await call()
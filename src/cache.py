@@ -0,0 +1,58 @@
+"""Short-lived response cache for read-only tool calls."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable
+
+
+class ResponseCache:
+    """TTL cache of response bodies with in-flight request coalescing.
+
+    Concurrent lookups for the same key share a single fetch, and the result
+    is kept for the ``ttl`` given with the lookup, so entries with different
+    lifetimes can share one cache. Failed fetches are not cached. A ``ttl``
+    of zero disables caching but still coalesces concurrent identical calls.
+
+    At most ``max_entries`` bodies are kept, evicting the least recently used
+    entry when full; a ``max_entries`` of zero or less stores nothing.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, bytes]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[bytes]] = {}
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[bytes]], ttl: float) -> bytes:
+        """Return the cached body for ``key``, fetching it if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, fetch, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        # Shield so a cancelled caller does not cancel the fetch other callers share
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: Hashable, fetch: Callable[[], Awaitable[bytes]], ttl: float) -> bytes:
+        """Run the fetch and store its result."""
+        body = await fetch()
+        if ttl > 0 and self._max_entries > 0:
+            while len(self._entries) >= self._max_entries:
+                # Hits move entries to the end, so the first one is the least recently used
+                self._entries.popitem(last=False)
+            self._entries[key] = (time.monotonic() + ttl, body)
+        return body
+
+    def _finish(self, key: Hashable, task: asyncio.Task[bytes]) -> None:
+        """Drop a completed fetch from the in-flight table."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            task.exception()
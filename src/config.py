@@ -2,68 +2,129 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+# Environment is read once at import; the dataclasses use these as plain defaults
+_AUDIO_ID_URL = os.getenv("AUDIO_ID_URL", "http://audio-id:8000")
+_IMAGE_OPT_URL = os.getenv("IMAGE_OPT_URL", "http://image-opt:8000")
+_OVERLAY_URL = os.getenv("OVERLAY_URL", "http://overlay:8000")
+_DISPATCHER_URL = os.getenv("DISPATCHER_URL", "http://dispatcher:8000")
+_MONITOR_URL = os.getenv("MONITOR_URL", "http://monitor:8000")
 
-@dataclass
+_RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "rabbitmq")
+_RABBITMQ_PORT = int(os.getenv("RABBITMQ_PORT", "5672"))
+_RABBITMQ_USER = os.getenv("RABBITMQ_USER", "guest")
+_RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "guest")
+
+_SAMBA_HOST = os.getenv("SAMBA_HOST", "samba")
+_SAMBA_SHARE = os.getenv("SAMBA_SHARE", "media")
+_SAMBA_USER = os.getenv("SAMBA_USER", "guest")
+_SAMBA_PASSWORD = os.getenv("SAMBA_PASSWORD", "")
+
+_HTTP_CLIENT_MAX_CONNECTIONS = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100"))
+_HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", "32")
+)
+_HTTP_CLIENT_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30.0"))
+_HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "true").lower() in ("1", "true", "yes")
+
+_MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT", "256"))
+_MAX_IN_FLIGHT_PER_SERVICE = int(os.getenv("MAX_IN_FLIGHT_PER_SERVICE", "64"))
+
+_CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "2.0"))
+_CACHE_TEMPLATES_TTL_SECONDS = float(os.getenv("CACHE_TEMPLATES_TTL_SECONDS", "60.0"))
+_CACHE_PREVIEW_TTL_SECONDS = float(os.getenv("CACHE_PREVIEW_TTL_SECONDS", "300.0"))
+_CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+
+_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     """Configuration for external service endpoints."""
 
-    audio_id_url: str = field(
-        default_factory=lambda: os.getenv("AUDIO_ID_URL", "http://audio-id:8000")
-    )
-    image_opt_url: str = field(
-        default_factory=lambda: os.getenv("IMAGE_OPT_URL", "http://image-opt:8000")
-    )
-    overlay_url: str = field(
-        default_factory=lambda: os.getenv("OVERLAY_URL", "http://overlay:8000")
-    )
-    dispatcher_url: str = field(
-        default_factory=lambda: os.getenv("DISPATCHER_URL", "http://dispatcher:8000")
-    )
-    monitor_url: str = field(
-        default_factory=lambda: os.getenv("MONITOR_URL", "http://monitor:8000")
-    )
-
-
-@dataclass
+    audio_id_url: str = _AUDIO_ID_URL
+    image_opt_url: str = _IMAGE_OPT_URL
+    overlay_url: str = _OVERLAY_URL
+    dispatcher_url: str = _DISPATCHER_URL
+    monitor_url: str = _MONITOR_URL
+
+
+@dataclass(frozen=True, slots=True)
 class RabbitMQConfig:
     """Configuration for RabbitMQ connection."""
 
-    host: str = field(default_factory=lambda: os.getenv("RABBITMQ_HOST", "rabbitmq"))
-    port: int = field(
-        default_factory=lambda: int(os.getenv("RABBITMQ_PORT", "5672"))
-    )
-    user: str = field(default_factory=lambda: os.getenv("RABBITMQ_USER", "guest"))
-    password: str = field(
-        default_factory=lambda: os.getenv("RABBITMQ_PASSWORD", "guest")
-    )
+    host: str = _RABBITMQ_HOST
+    port: int = _RABBITMQ_PORT
+    user: str = _RABBITMQ_USER
+    password: str = _RABBITMQ_PASSWORD
+    url: str = field(init=False, repr=False)
 
-    @property
-    def url(self) -> str:
-        """Return AMQP connection URL."""
-        return f"amqp://{self.user}:{self.password}@{self.host}:{self.port}/"
+    def __post_init__(self) -> None:
+        """Build the AMQP connection URL once, since the config is immutable."""
+        object.__setattr__(
+            self, "url", f"amqp://{self.user}:{self.password}@{self.host}:{self.port}/"
+        )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SambaConfig:
     """Configuration for Samba share."""
 
-    host: str = field(default_factory=lambda: os.getenv("SAMBA_HOST", "samba"))
-    share: str = field(default_factory=lambda: os.getenv("SAMBA_SHARE", "media"))
-    user: str = field(default_factory=lambda: os.getenv("SAMBA_USER", "guest"))
-    password: str = field(default_factory=lambda: os.getenv("SAMBA_PASSWORD", ""))
+    host: str = _SAMBA_HOST
+    share: str = _SAMBA_SHARE
+    user: str = _SAMBA_USER
+    password: str = _SAMBA_PASSWORD
+
 
+@dataclass(frozen=True, slots=True)
+class HttpClientConfig:
+    """Configuration for the HTTP clients used to call the services.
 
-@dataclass
+    Each service has its own client, so the pool limits apply per service.
+    """
+
+    max_connections: int = _HTTP_CLIENT_MAX_CONNECTIONS
+    max_keepalive_connections: int = _HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = _HTTP_CLIENT_KEEPALIVE_EXPIRY
+    http2: bool = _HTTP_CLIENT_HTTP2
+
+
+@dataclass(frozen=True, slots=True)
+class BackpressureConfig:
+    """Configuration for limiting concurrent calls to the services."""
+
+    max_in_flight: int = _MAX_IN_FLIGHT
+    max_in_flight_per_service: int = _MAX_IN_FLIGHT_PER_SERVICE
+
+
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
+    """Configuration for caching responses of read-only tools."""
+
+    ttl_seconds: float = _CACHE_TTL_SECONDS
+    templates_ttl_seconds: float = _CACHE_TEMPLATES_TTL_SECONDS
+    preview_ttl_seconds: float = _CACHE_PREVIEW_TTL_SECONDS
+    max_entries: int = _CACHE_MAX_ENTRIES
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration for home-display-agent."""
 
     services: ServiceConfig = field(default_factory=ServiceConfig)
     rabbitmq: RabbitMQConfig = field(default_factory=RabbitMQConfig)
     samba: SambaConfig = field(default_factory=SambaConfig)
-    log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    http_client: HttpClientConfig = field(default_factory=HttpClientConfig)
+    backpressure: BackpressureConfig = field(default_factory=BackpressureConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    log_level: str = _LOG_LEVEL
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment variables."""
+    """Load configuration from environment variables.
+
+    The result is cached, so repeated calls return the same instance.
+    """
     return Config()
@@ -1,504 +1,781 @@
 """Main entry point for the home-display-agent MCP server."""
 
 import asyncio
+import base64
+import contextlib
+import hashlib
+import json
 import logging
-from typing import Any
+import random
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable
+from urllib.parse import quote
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import CallToolResult, Tool, TextContent
 import httpx
-
-from src.config import load_config, Config
+import orjson
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from src.backpressure import Backpressure
+from src.cache import ResponseCache
+from src.config import load_config, Config, ServiceConfig
+from src.tools.audio_id import AUDIO_ID_TOOLS
+from src.tools.dispatcher import DISPATCHER_TOOLS
+from src.tools.image_opt import IMAGE_OPT_TOOLS
+from src.tools.monitor import MONITOR_TOOLS
+from src.tools.overlay import OVERLAY_TOOLS
 
 logger = logging.getLogger("home-display-agent")
 
+# Request bodies are encoded with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Errors from the HTTP client that are reported back as tool results
+_HTTP_EXC = (httpx.HTTPStatusError, httpx.RequestError)
+
+# Bytes of an error response body included in the tool result
+_ERROR_BODY_LIMIT = 512
+
+# Request timeouts, built once and shared rather than passed as bare floats.
+# Health probes use a short timeout so one unreachable service does not hold up
+# monitor_health for the full request timeout.
+_TIMEOUT = httpx.Timeout(60.0)
+_PROBE_TIMEOUT = httpx.Timeout(5.0)
+
+# Retries of idempotent requests on transport errors and 5xx responses. The
+# backoff ceiling grows 4x per attempt from the base delay (50ms, 200ms, ...).
+_RETRY_EXC = (httpx.HTTPStatusError, httpx.TransportError)
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.05
+_RETRY_MAX_DELAY = 1.0
+
+# Backend services; each gets its own HTTP client and concurrency limit
+_SERVICES = ("audio_id", "image_opt", "overlay", "dispatcher", "monitor")
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoints:
+    """Backend endpoint URLs, built once from the service config.
+
+    Endpoints that take a path parameter are stored as a pre-parsed
+    ``httpx.URL`` base; handlers only swap in the path, so the scheme and
+    host are not re-parsed on every call.
+    """
+
+    audio_identify: str
+    audio_status_base: httpx.URL
+    image_optimize: str
+    image_info: str
+    image_optimize_batch: str
+    image_job_base: httpx.URL
+    overlay_create: str
+    overlay_templates: str
+    overlay_preview: str
+    dispatcher_enqueue: str
+    dispatcher_queue_status: str
+    dispatcher_job_base: httpx.URL
+    monitor_health: str
+    monitor_stream_status: str
+    monitor_failures: str
+    monitor_metrics: str
+    service_health: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_services(cls, services: ServiceConfig) -> "Endpoints":
+        """Build the endpoint URLs for the configured services."""
+        return cls(
+            audio_identify=f"{services.audio_id_url}/identify",
+            audio_status_base=httpx.URL(f"{services.audio_id_url}/status/"),
+            image_optimize=f"{services.image_opt_url}/optimize",
+            image_info=f"{services.image_opt_url}/info",
+            image_optimize_batch=f"{services.image_opt_url}/optimize/batch",
+            image_job_base=httpx.URL(f"{services.image_opt_url}/jobs/"),
+            overlay_create=f"{services.overlay_url}/create",
+            overlay_templates=f"{services.overlay_url}/templates",
+            overlay_preview=f"{services.overlay_url}/preview",
+            dispatcher_enqueue=f"{services.dispatcher_url}/enqueue",
+            dispatcher_queue_status=f"{services.dispatcher_url}/queue/status",
+            dispatcher_job_base=httpx.URL(f"{services.dispatcher_url}/job/"),
+            monitor_health=f"{services.monitor_url}/health",
+            monitor_stream_status=f"{services.monitor_url}/stream/status",
+            monitor_failures=f"{services.monitor_url}/failures",
+            monitor_metrics=f"{services.monitor_url}/metrics",
+            service_health=(
+                ("audio_id", f"{services.audio_id_url}/health"),
+                ("image_opt", f"{services.image_opt_url}/health"),
+                ("overlay", f"{services.overlay_url}/health"),
+                ("dispatcher", f"{services.dispatcher_url}/health"),
+                ("monitor", f"{services.monitor_url}/health"),
+            ),
+        )
+
+
+def _join_path(base: httpx.URL, segment: str) -> httpx.URL:
+    """Append a path segment to a pre-parsed base URL.
+
+    The segment is percent-encoded, so ``/``, ``?`` and ``#`` stay part of it
+    and a ``.`` or ``..`` value cannot step out of the base path.
+    """
+    quoted = quote(segment, safe="")
+    if quoted in (".", ".."):
+        quoted = quoted.replace(".", "%2E")
+    return base.copy_with(path=base.path + quoted)
+
 
-def create_server(config: Config) -> Server:
-    """Create and configure the MCP server with all tools."""
+# Tool definitions, built once at import
+_TOOLS: list[Tool] = (
+    AUDIO_ID_TOOLS + IMAGE_OPT_TOOLS + OVERLAY_TOOLS + DISPATCHER_TOOLS + MONITOR_TOOLS
+)
+
+# Input validators, built once per schema. The MCP server's built-in validation
+# re-checks the schema and rebuilds a validator on every call, so it is disabled
+# in favour of these.
+_VALIDATORS = {
+    tool.name: validator_for(tool.inputSchema)(tool.inputSchema) for tool in _TOOLS
+}
+
+
+def create_server(config: Config, clients: dict[str, httpx.AsyncClient]) -> Server:
+    """Create and configure the MCP server with all tools.
+
+    ``clients`` maps each service to a long-lived client. Tool calls use the
+    client of the service they call, so each service keeps its own warm
+    keep-alive pool and a burst to one service cannot use up another's.
+    """
     server = Server("home-display-agent")
+    endpoints = Endpoints.from_services(config.services)
+    specs = _build_specs(config)
+    cache = ResponseCache(config.cache.max_entries)
+    backpressure = Backpressure(
+        config.backpressure.max_in_flight,
+        config.backpressure.max_in_flight_per_service,
+        _SERVICES,
+    )
 
-    # Tool definitions
-    TOOLS = [
-        # Audio ID tools
-        Tool(
-            name="audio_identify",
-            description="Identify audio content from a file or stream",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "Path or URL to the audio source",
-                    },
-                    "duration": {
-                        "type": "integer",
-                        "description": "Duration in seconds to analyze",
-                        "default": 10,
-                    },
-                },
-                "required": ["source"],
-            },
-        ),
-        Tool(
-            name="audio_status",
-            description="Get the status of an audio identification job",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "job_id": {
-                        "type": "string",
-                        "description": "The job ID to check",
-                    },
-                },
-                "required": ["job_id"],
-            },
-        ),
-        # Image optimization tools
-        Tool(
-            name="image_optimize",
-            description="Optimize an image for display",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "Path or URL to the image",
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Target width in pixels",
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "Target height in pixels",
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Output format (jpeg, png, webp)",
-                        "enum": ["jpeg", "png", "webp"],
-                        "default": "webp",
-                    },
-                    "quality": {
-                        "type": "integer",
-                        "description": "Output quality (1-100)",
-                        "default": 85,
-                    },
-                },
-                "required": ["source"],
-            },
-        ),
-        Tool(
-            name="image_info",
-            description="Get metadata and info about an image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "Path or URL to the image",
-                    },
-                },
-                "required": ["source"],
-            },
-        ),
-        # Overlay tools
-        Tool(
-            name="overlay_create",
-            description="Create an overlay image with text and graphics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template": {
-                        "type": "string",
-                        "description": "Template name to use",
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "Data to populate the template",
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Overlay width in pixels",
-                        "default": 1920,
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "Overlay height in pixels",
-                        "default": 1080,
-                    },
-                },
-                "required": ["template", "data"],
-            },
-        ),
-        Tool(
-            name="overlay_list_templates",
-            description="List available overlay templates",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="overlay_preview",
-            description="Generate a preview of an overlay",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template": {
-                        "type": "string",
-                        "description": "Template name to use",
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "Data to populate the template",
-                    },
-                },
-                "required": ["template", "data"],
-            },
-        ),
-        # Dispatcher tools
-        Tool(
-            name="dispatcher_enqueue",
-            description="Enqueue a display job for processing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "job_type": {
-                        "type": "string",
-                        "description": "Type of job (image, video, slideshow)",
-                        "enum": ["image", "video", "slideshow"],
-                    },
-                    "source": {
-                        "type": "string",
-                        "description": "Path or URL to the content",
-                    },
-                    "priority": {
-                        "type": "integer",
-                        "description": "Job priority (higher = more urgent)",
-                        "default": 5,
-                    },
-                    "options": {
-                        "type": "object",
-                        "description": "Additional job options",
-                    },
-                },
-                "required": ["job_type", "source"],
-            },
-        ),
-        Tool(
-            name="dispatcher_queue_status",
-            description="Get the current queue status",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="dispatcher_job_status",
-            description="Get the status of a specific job",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "job_id": {
-                        "type": "string",
-                        "description": "The job ID to check",
-                    },
-                },
-                "required": ["job_id"],
-            },
-        ),
-        Tool(
-            name="dispatcher_cancel",
-            description="Cancel a pending or running job",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "job_id": {
-                        "type": "string",
-                        "description": "The job ID to cancel",
-                    },
-                },
-                "required": ["job_id"],
-            },
-        ),
-        # Monitor tools
-        Tool(
-            name="monitor_health",
-            description="Check the health status of all services",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="monitor_stream_status",
-            description="Get the current stream/display status",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="monitor_failures",
-            description="Get recent failures and errors",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of failures to return",
-                        "default": 10,
-                    },
-                    "service": {
-                        "type": "string",
-                        "description": "Filter by service name",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="monitor_metrics",
-            description="Get system metrics and statistics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "period": {
-                        "type": "string",
-                        "description": "Time period for metrics",
-                        "enum": ["1h", "6h", "24h", "7d"],
-                        "default": "1h",
-                    },
-                },
-            },
-        ),
-    ]
+    async def run(name: str, arguments: dict) -> bytes:
+        """Run a tool by name; composite tools run their parts through this."""
+        spec = specs[name]
+        if spec.composite:
+            # No backpressure slot of its own; each part takes one
+            return await spec.handler(run, arguments)
+        return await _execute_tool(name, spec, arguments, endpoints, clients[spec.service], cache, backpressure)
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List all available tools."""
-        return TOOLS
+        # Returned as-is, without copying. The MCP session serializes the
+        # response itself, so there is no hook to hand it pre-encoded JSON.
+        return _TOOLS
 
-    @server.call_tool()
-    async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolResult:
         """Handle tool calls."""
+        spec = specs.get(name)
+        if spec is None:
+            # Reject before logging the arguments or taking the exception path
+            logger.warning("Unknown tool requested: name=%s", name)
+            return [TextContent(type="text", text=f"Error executing tool {name}: Unknown tool: {name}")]
+        error = best_match(_VALIDATORS[name].iter_errors(arguments))
+        if error is not None:
+            logger.warning("Invalid tool arguments: name=%s, error=%s", name, error.message)
+            # Flagged as an error, as the MCP server's built-in validation does
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"Input validation error: {error.message}")],
+                isError=True,
+            )
         logger.info("Tool invoked: name=%s, arguments=%s", name, arguments)
         try:
-            result = await _execute_tool(name, arguments, config)
-            logger.debug("Tool execution successful: name=%s, result_keys=%s", name, list(result.keys()) if isinstance(result, dict) else type(result).__name__)
-            return [TextContent(type="text", text=str(result))]
-        except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP error: {e.response.status_code} - {e.response.text}"
-            logger.error("HTTP error during tool execution: tool=%s, status=%d, url=%s, response=%s",
-                        name, e.response.status_code, e.request.url, e.response.text)
-            return [TextContent(type="text", text=error_msg)]
-        except httpx.RequestError as e:
-            error_msg = f"Request error: {str(e)}"
-            logger.error("Network error during tool execution: tool=%s, error=%s", name, str(e), exc_info=True)
+            body = await run(name, arguments)
+            logger.debug("Tool execution successful: name=%s, result_bytes=%d", name, len(body))
+            return [TextContent(type="text", text=body.decode())]
+        except _HTTP_EXC as e:
+            if isinstance(e, httpx.HTTPStatusError):
+                status_code = e.response.status_code
+                # Only the start of the body is decoded; error pages can be large
+                detail = e.response.content[:_ERROR_BODY_LIMIT].decode(errors="replace")
+                error_msg = f"HTTP error: {status_code} - {detail}"
+                logger.error("HTTP error during tool execution: tool=%s, status=%d, url=%s",
+                            name, status_code, e.request.url)
+                logger.debug("HTTP error response body: tool=%s, response=%s", name, detail)
+            else:
+                error_msg = f"Request error: {e}"
+                logger.error("Network error during tool execution: tool=%s, error=%s", name, e, exc_info=True)
             return [TextContent(type="text", text=error_msg)]
         except Exception as e:
-            error_msg = f"Error executing tool {name}: {str(e)}"
-            logger.error("Unexpected error during tool execution: tool=%s, error=%s", name, str(e), exc_info=True)
+            error_msg = f"Error executing tool {name}: {e}"
+            logger.error("Unexpected error during tool execution: tool=%s, error=%s", name, e, exc_info=True)
             return [TextContent(type="text", text=error_msg)]
 
     return server
 
 
-async def _execute_tool(name: str, arguments: dict, config: Config) -> dict[str, Any]:
-    """Execute a tool and return the result."""
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # Audio ID tools
-        if name == "audio_identify":
-            url = f"{config.services.audio_id_url}/identify"
-            payload = {
-                "source": arguments["source"],
-                "duration": arguments.get("duration", 10),
-            }
-            logger.info("Requesting audio identification: url=%s, source=%s, duration=%d",
-                       url, arguments["source"], payload["duration"])
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            logger.info("Audio identification complete: source=%s, status=%d", arguments["source"], response.status_code)
-            return result
-
-        elif name == "audio_status":
-            url = f"{config.services.audio_id_url}/status/{arguments['job_id']}"
-            logger.debug("Checking audio identification status: url=%s, job_id=%s", url, arguments['job_id'])
-            response = await client.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("Audio status retrieved: job_id=%s, status=%d", arguments['job_id'], response.status_code)
-            return result
-
-        # Image optimization tools
-        elif name == "image_optimize":
-            payload = {
-                "source": arguments["source"],
-                "format": arguments.get("format", "webp"),
-                "quality": arguments.get("quality", 85),
-            }
-            if "width" in arguments:
-                payload["width"] = arguments["width"]
-            if "height" in arguments:
-                payload["height"] = arguments["height"]
-            url = f"{config.services.image_opt_url}/optimize"
-            logger.info("Requesting image optimization: url=%s, source=%s, format=%s, quality=%d, dimensions=%sx%s",
-                       url, arguments["source"], payload["format"], payload["quality"],
-                       payload.get("width", "auto"), payload.get("height", "auto"))
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            logger.info("Image optimization complete: source=%s, status=%d", arguments["source"], response.status_code)
-            return result
-
-        elif name == "image_info":
-            url = f"{config.services.image_opt_url}/info"
-            logger.debug("Requesting image info: url=%s, source=%s", url, arguments["source"])
-            response = await client.post(url, json={"source": arguments["source"]})
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("Image info retrieved: source=%s, status=%d", arguments["source"], response.status_code)
-            return result
-
-        # Overlay tools
-        elif name == "overlay_create":
-            payload = {
-                "template": arguments["template"],
-                "data": arguments["data"],
-                "width": arguments.get("width", 1920),
-                "height": arguments.get("height", 1080),
-            }
-            url = f"{config.services.overlay_url}/create"
-            logger.info("Requesting overlay creation: url=%s, template=%s, dimensions=%dx%d, data_keys=%s",
-                       url, arguments["template"], payload["width"], payload["height"],
-                       list(arguments["data"].keys()) if isinstance(arguments["data"], dict) else "unknown")
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            logger.info("Overlay creation complete: template=%s, status=%d", arguments["template"], response.status_code)
-            return result
-
-        elif name == "overlay_list_templates":
-            url = f"{config.services.overlay_url}/templates"
-            logger.debug("Requesting overlay templates list: url=%s", url)
-            response = await client.get(url)
-            response.raise_for_status()
-            result = response.json()
-            template_count = len(result) if isinstance(result, list) else "unknown"
-            logger.debug("Overlay templates retrieved: count=%s, status=%d", template_count, response.status_code)
-            return result
-
-        elif name == "overlay_preview":
-            payload = {
-                "template": arguments["template"],
-                "data": arguments["data"],
-            }
-            url = f"{config.services.overlay_url}/preview"
-            logger.debug("Requesting overlay preview: url=%s, template=%s", url, arguments["template"])
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("Overlay preview complete: template=%s, status=%d", arguments["template"], response.status_code)
-            return result
-
-        # Dispatcher tools
-        elif name == "dispatcher_enqueue":
-            payload = {
-                "job_type": arguments["job_type"],
-                "source": arguments["source"],
-                "priority": arguments.get("priority", 5),
-            }
-            if "options" in arguments:
-                payload["options"] = arguments["options"]
-            url = f"{config.services.dispatcher_url}/enqueue"
-            logger.info("Enqueueing job: url=%s, job_type=%s, source=%s, priority=%d",
-                       url, payload["job_type"], payload["source"], payload["priority"])
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            logger.info("Job enqueued: job_type=%s, status=%d", payload["job_type"], response.status_code)
-            return result
-
-        elif name == "dispatcher_queue_status":
-            url = f"{config.services.dispatcher_url}/queue/status"
-            logger.debug("Requesting queue status: url=%s", url)
-            response = await client.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("Queue status retrieved: status=%d", response.status_code)
-            return result
-
-        elif name == "dispatcher_job_status":
-            url = f"{config.services.dispatcher_url}/job/{arguments['job_id']}"
-            logger.debug("Checking job status: url=%s, job_id=%s", url, arguments['job_id'])
-            response = await client.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("Job status retrieved: job_id=%s, status=%d", arguments['job_id'], response.status_code)
-            return result
-
-        elif name == "dispatcher_cancel":
-            url = f"{config.services.dispatcher_url}/job/{arguments['job_id']}"
-            logger.info("Cancelling job: url=%s, job_id=%s", url, arguments['job_id'])
-            response = await client.delete(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.info("Job cancelled: job_id=%s, status=%d", arguments['job_id'], response.status_code)
-            return result
-
-        # Monitor tools
-        elif name == "monitor_health":
-            url = f"{config.services.monitor_url}/health"
-            logger.debug("Requesting system health: url=%s", url)
-            response = await client.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("System health retrieved: status=%d", response.status_code)
-            return result
-
-        elif name == "monitor_stream_status":
-            url = f"{config.services.monitor_url}/stream/status"
-            logger.debug("Requesting stream status: url=%s", url)
-            response = await client.get(url)
-            response.raise_for_status()
-            result = response.json()
-            logger.debug("Stream status retrieved: status=%d", response.status_code)
-            return result
-
-        elif name == "monitor_failures":
-            params = {"limit": arguments.get("limit", 10)}
-            if "service" in arguments:
-                params["service"] = arguments["service"]
-            url = f"{config.services.monitor_url}/failures"
-            logger.debug("Requesting failures: url=%s, limit=%d, service=%s",
-                        url, params["limit"], params.get("service", "all"))
-            response = await client.get(url, params=params)
+def _encode_json(payload: Any) -> bytes:
+    """Encode a request body as JSON.
+
+    orjson only handles 64-bit integers, while free-form fields such as
+    dispatcher ``options`` and overlay ``data`` accept any JSON number, so
+    those fall back to the stdlib encoder.
+    """
+    try:
+        return orjson.dumps(payload)
+    except TypeError:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+async def _call(
+    client: httpx.AsyncClient,
+    method: str,
+    url: httpx.URL | str,
+    payload: Any = None,
+    params: dict | None = None,
+    idempotent: bool | None = None,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """Send a request to a service and raise on an error status.
+
+    ``payload`` is sent as an orjson-encoded JSON body when given, with
+    ``headers`` (JSON content type by default). Idempotent
+    requests (GETs unless ``idempotent`` says otherwise) that fail with a
+    transport error or a 5xx status are retried with jittered exponential
+    backoff.
+    """
+    if payload is None:
+        content = None
+    else:
+        content = _encode_json(payload)
+        if headers is None:
+            headers = _JSON_HEADERS
+    if idempotent is None:
+        idempotent = method == "GET"
+    attempts = _RETRY_ATTEMPTS if idempotent else 1
+    for attempt in range(1, attempts + 1):
+        try:
+            response = await client.request(method, url, content=content, params=params, headers=headers)
             response.raise_for_status()
-            result = response.json()
-            failure_count = len(result) if isinstance(result, list) else "unknown"
-            logger.debug("Failures retrieved: count=%s, status=%d", failure_count, response.status_code)
-            return result
-
-        elif name == "monitor_metrics":
-            params = {"period": arguments.get("period", "1h")}
-            url = f"{config.services.monitor_url}/metrics"
-            logger.debug("Requesting metrics: url=%s, period=%s", url, params["period"])
-            response = await client.get(url, params=params)
+            return response
+        except _RETRY_EXC as e:
+            if isinstance(e, httpx.HTTPStatusError):
+                if e.response.status_code < 500:
+                    raise
+                reason = e.response.status_code
+            else:
+                reason = e
+            if attempt == attempts:
+                raise
+            # Full jitter, so retries from concurrent callers spread out
+            delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 4 ** (attempt - 1)))
+            logger.warning("Retrying request: method=%s, url=%s, attempt=%d, delay=%.3fs, error=%s",
+                          method, url, attempt, delay, reason)
+        await asyncio.sleep(delay)
+
+
+def _embed(body: bytes) -> Any:
+    """Prepare a service response body for embedding in a composite result.
+
+    Valid JSON is embedded as-is with ``orjson.Fragment``, so it is not
+    re-encoded. An empty body becomes ``null`` and any other non-JSON body is
+    embedded as a string, so one odd response cannot make the whole result
+    invalid JSON.
+    """
+    if not body:
+        return None
+    try:
+        orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body.decode(errors="replace")
+    return orjson.Fragment(body)
+
+
+# Default payload fields; handlers copy these and only override what the caller set
+_IMAGE_OPTIMIZE_DEFAULTS = {"format": "webp", "quality": 85}
+_OVERLAY_CREATE_DEFAULTS = {"width": 1920, "height": 1080}
+
+# Read size when streaming binary responses
+_STREAM_CHUNK_SIZE = 65536
+
+# Request headers asking the image-opt service for the image itself, per format
+_IMAGE_ACCEPT_HEADERS = {
+    fmt: {**_JSON_HEADERS, "Accept": f"image/{fmt}"} for fmt in ("jpeg", "png", "webp")
+}
+
+# Asks the image-opt service to queue the work and answer 202 with a job ID
+_ASYNC_JSON_HEADERS = {**_JSON_HEADERS, "Prefer": "respond-async"}
+
+
+# Audio ID tools
+async def _audio_identify(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Identify audio content from a file or stream."""
+    url = endpoints.audio_identify
+    source = arguments["source"]
+    duration = arguments.get("duration", 10)
+    payload = {"source": source, "duration": duration}
+    logger.info("Requesting audio identification: url=%s, source=%s, duration=%d",
+               url, source, duration)
+    response = await _call(client, "POST", url, payload)
+    body = response.content
+    logger.info("Audio identification complete: source=%s, status=%d", source, response.status_code)
+    return body
+
+
+async def _audio_status(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get the status of an audio identification job."""
+    job_id = arguments["job_id"]
+    url = _join_path(endpoints.audio_status_base, job_id)
+    logger.debug("Checking audio identification status: url=%s, job_id=%s", url, job_id)
+    response = await _call(client, "GET", url)
+    body = response.content
+    logger.debug("Audio status retrieved: job_id=%s, status=%d", job_id, response.status_code)
+    return body
+
+
+# Image optimization tools
+def _image_optimize_payload(arguments: dict) -> dict:
+    """Build the /optimize request body, applying the format and quality defaults."""
+    width = arguments.get("width")
+    height = arguments.get("height")
+    fmt = arguments.get("format")
+    quality = arguments.get("quality")
+    payload = {"source": arguments["source"], **_IMAGE_OPTIMIZE_DEFAULTS}
+    if fmt is not None:
+        payload["format"] = fmt
+    if quality is not None:
+        payload["quality"] = quality
+    if width is not None:
+        payload["width"] = width
+    if height is not None:
+        payload["height"] = height
+    return payload
+
+
+async def _image_optimize(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Optimize an image for display."""
+    payload = _image_optimize_payload(arguments)
+    source = payload["source"]
+    url = endpoints.image_optimize
+    logger.info("Requesting image optimization: url=%s, source=%s, format=%s, quality=%d, dimensions=%sx%s",
+               url, source, payload["format"], payload["quality"],
+               payload.get("width", "auto"), payload.get("height", "auto"))
+    if arguments.get("raw", False):
+        return await _image_optimize_raw(client, url, payload)
+    response = await _call(client, "POST", url, payload)
+    body = response.content
+    logger.info("Image optimization complete: source=%s, status=%d", source, response.status_code)
+    return body
+
+
+async def _image_optimize_raw(client: httpx.AsyncClient, url: str, payload: dict) -> bytes:
+    """Request the optimized image as binary and return it base64-encoded.
+
+    The body is streamed into a single buffer rather than read as a JSON
+    response and parsed. The result still holds the image several times over
+    at its peak (buffer, base64, the JSON result and the decoded tool text).
+    This bypasses ``_call``, which reads the whole body before returning and
+    retries, neither of which suits a streamed, non-idempotent POST.
+    """
+    headers = _IMAGE_ACCEPT_HEADERS[payload["format"]]
+    buffer = bytearray()
+    async with client.stream("POST", url, content=_encode_json(payload), headers=headers) as response:
+        if not response.is_success:
+            # Redirects and errors are rejected, as in _call. Read the body so
+            # the error handler can report it.
+            await response.aread()
             response.raise_for_status()
-            result = response.json()
-            logger.debug("Metrics retrieved: period=%s, status=%d", params["period"], response.status_code)
-            return result
-
+        async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+            buffer += chunk
+    # Reported as received (null if missing), so a non-image body is never labeled as one
+    content_type = response.headers.get("Content-Type")
+    logger.info("Image optimization complete: source=%s, status=%d, bytes=%d",
+               payload["source"], response.status_code, len(buffer))
+    return orjson.dumps({
+        "content_type": content_type,
+        "bytes_b64": base64.b64encode(buffer).decode("ascii"),
+    })
+
+
+async def _image_optimize_batch(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Optimize several images for display in one request."""
+    items = [{**_IMAGE_OPTIMIZE_DEFAULTS, **item} for item in arguments["items"]]
+    url = endpoints.image_optimize_batch
+    logger.info("Requesting batch image optimization: url=%s, count=%d", url, len(items))
+    response = await _call(client, "POST", url, {"items": items})
+    body = response.content
+    logger.info("Batch image optimization complete: count=%d, status=%d", len(items), response.status_code)
+    return body
+
+
+async def _image_optimize_async(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Start optimizing an image in the background."""
+    payload = _image_optimize_payload(arguments)
+    source = payload["source"]
+    url = endpoints.image_optimize
+    logger.info("Submitting background image optimization: url=%s, source=%s", url, source)
+    response = await _call(client, "POST", url, payload, headers=_ASYNC_JSON_HEADERS)
+    body = response.content
+    logger.info("Background image optimization submitted: source=%s, status=%d", source, response.status_code)
+    return body
+
+
+async def _image_job_status(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get the status of a background image optimization job."""
+    job_id = arguments["job_id"]
+    url = _join_path(endpoints.image_job_base, job_id)
+    logger.debug("Checking image job status: url=%s, job_id=%s", url, job_id)
+    response = await _call(client, "GET", url)
+    body = response.content
+    logger.debug("Image job status retrieved: job_id=%s, status=%d", job_id, response.status_code)
+    return body
+
+
+async def _image_info(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get metadata and info about an image."""
+    url = endpoints.image_info
+    source = arguments["source"]
+    logger.debug("Requesting image info: url=%s, source=%s", url, source)
+    response = await _call(client, "POST", url, {"source": source}, idempotent=True)
+    body = response.content
+    logger.debug("Image info retrieved: source=%s, status=%d", source, response.status_code)
+    return body
+
+
+# Overlay tools
+async def _overlay_create(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Create an overlay image with text and graphics."""
+    template = arguments["template"]
+    data = arguments["data"]
+    width = arguments.get("width")
+    height = arguments.get("height")
+    payload = {"template": template, "data": data, **_OVERLAY_CREATE_DEFAULTS}
+    if width is not None:
+        payload["width"] = width
+    if height is not None:
+        payload["height"] = height
+    url = endpoints.overlay_create
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Requesting overlay creation: url=%s, template=%s, dimensions=%dx%d, data_keys=%s",
+                   url, template, payload["width"], payload["height"],
+                   list(data.keys()) if isinstance(data, dict) else "unknown")
+    response = await _call(client, "POST", url, payload)
+    body = response.content
+    logger.info("Overlay creation complete: template=%s, status=%d", template, response.status_code)
+    return body
+
+
+async def _overlay_list_templates(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """List available overlay templates."""
+    url = endpoints.overlay_templates
+    logger.debug("Requesting overlay templates list: url=%s", url)
+    response = await _call(client, "GET", url)
+    body = response.content
+    if logger.isEnabledFor(logging.DEBUG):
+        # Only for the log line; a body that is not JSON is passed through as-is
+        try:
+            templates = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            templates = None
+        template_count = len(templates) if isinstance(templates, list) else "unknown"
+        logger.debug("Overlay templates retrieved: count=%s, status=%d", template_count, response.status_code)
+    return body
+
+
+async def _overlay_preview(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Generate a preview of an overlay."""
+    template = arguments["template"]
+    payload = {"template": template, "data": arguments["data"]}
+    url = endpoints.overlay_preview
+    logger.debug("Requesting overlay preview: url=%s, template=%s", url, template)
+    response = await _call(client, "POST", url, payload)
+    body = response.content
+    logger.debug("Overlay preview complete: template=%s, status=%d", template, response.status_code)
+    return body
+
+
+# Dispatcher tools
+async def _dispatcher_enqueue(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Enqueue a display job for processing."""
+    job_type = arguments["job_type"]
+    source = arguments["source"]
+    priority = arguments.get("priority", 5)
+    options = arguments.get("options")
+    payload = {"job_type": job_type, "source": source, "priority": priority}
+    if options is not None:
+        payload["options"] = options
+    url = endpoints.dispatcher_enqueue
+    logger.info("Enqueueing job: url=%s, job_type=%s, source=%s, priority=%d",
+               url, job_type, source, priority)
+    response = await _call(client, "POST", url, payload)
+    body = response.content
+    logger.info("Job enqueued: job_type=%s, status=%d", job_type, response.status_code)
+    return body
+
+
+async def _dispatcher_queue_status(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get the current queue status."""
+    url = endpoints.dispatcher_queue_status
+    logger.debug("Requesting queue status: url=%s", url)
+    response = await _call(client, "GET", url)
+    body = response.content
+    logger.debug("Queue status retrieved: status=%d", response.status_code)
+    return body
+
+
+async def _dispatcher_job_status(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get the status of a specific job."""
+    job_id = arguments["job_id"]
+    url = _join_path(endpoints.dispatcher_job_base, job_id)
+    logger.debug("Checking job status: url=%s, job_id=%s", url, job_id)
+    response = await _call(client, "GET", url)
+    body = response.content
+    logger.debug("Job status retrieved: job_id=%s, status=%d", job_id, response.status_code)
+    return body
+
+
+async def _dispatcher_cancel(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Cancel a pending or running job."""
+    job_id = arguments["job_id"]
+    url = _join_path(endpoints.dispatcher_job_base, job_id)
+    logger.info("Cancelling job: url=%s, job_id=%s", url, job_id)
+    response = await _call(client, "DELETE", url)
+    body = response.content
+    logger.info("Job cancelled: job_id=%s, status=%d", job_id, response.status_code)
+    return body
+
+
+async def _dispatcher_bulk_status(
+    client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints, max_concurrency: int
+) -> bytes:
+    """Get the status of several jobs, fetching up to ``max_concurrency`` at a time."""
+    # Results are keyed by ID, so fetch each distinct ID once
+    job_ids = list(dict.fromkeys(arguments["job_ids"]))
+    logger.debug("Checking bulk job status: count=%d", len(job_ids))
+    # The whole call holds one backpressure slot, so bound its own fan-out too
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def job_status(job_id: str) -> bytes:
+        async with semaphore:
+            return await _dispatcher_job_status(client, {"job_id": job_id}, endpoints)
+
+    results = await asyncio.gather(*(job_status(job_id) for job_id in job_ids), return_exceptions=True)
+    # A job that cannot be fetched is reported in place rather than failing the batch
+    jobs: dict[str, Any] = {}
+    for job_id, result in zip(job_ids, results):
+        if isinstance(result, httpx.HTTPStatusError):
+            jobs[job_id] = {"error": "HTTP error", "status_code": result.response.status_code}
+        elif isinstance(result, httpx.RequestError):
+            jobs[job_id] = {"error": f"Request error: {result}"}
+        elif isinstance(result, BaseException):
+            raise result
         else:
-            raise ValueError(f"Unknown tool: {name}")
+            jobs[job_id] = _embed(result)
+    return orjson.dumps({"jobs": jobs})
+
+
+# Monitor tools
+async def _monitor_health(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Check the health status of all services."""
+    url = endpoints.monitor_health
+    logger.debug("Requesting system health: url=%s", url)
+    if not arguments.get("probe_services", False):
+        response = await _call(client, "GET", url)
+        body = response.content
+        logger.debug("System health retrieved: status=%d", response.status_code)
+        return body
+
+    # Query the monitor and probe every service concurrently
+    response, *probes = await asyncio.gather(
+        _call(client, "GET", url),
+        *(_probe_health(client, health_url) for _, health_url in endpoints.service_health),
+    )
+    body = orjson.dumps({
+        "monitor": _embed(response.content),
+        "services": {
+            service: probe for (service, _), probe in zip(endpoints.service_health, probes)
+        },
+    })
+    logger.debug("System health retrieved: status=%d, probed=%d", response.status_code, len(probes))
+    return body
+
+
+async def _probe_health(client: httpx.AsyncClient, url: str) -> dict[str, Any]:
+    """Probe a service's health endpoint, reporting failures instead of raising."""
+    try:
+        response = await client.get(url, timeout=_PROBE_TIMEOUT)
+    except httpx.RequestError as e:
+        return {"healthy": False, "error": str(e)}
+    return {"healthy": response.is_success, "status_code": response.status_code}
+
+
+async def _monitor_stream_status(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get the current stream/display status."""
+    url = endpoints.monitor_stream_status
+    logger.debug("Requesting stream status: url=%s", url)
+    response = await _call(client, "GET", url)
+    body = response.content
+    logger.debug("Stream status retrieved: status=%d", response.status_code)
+    return body
+
+
+async def _monitor_failures(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get recent failures and errors."""
+    limit = arguments.get("limit", 10)
+    service = arguments.get("service")
+    params = {"limit": limit}
+    if service is not None:
+        params["service"] = service
+    url = endpoints.monitor_failures
+    logger.debug("Requesting failures: url=%s, limit=%d, service=%s",
+                url, limit, service or "all")
+    response = await _call(client, "GET", url, params=params)
+    body = response.content
+    if logger.isEnabledFor(logging.DEBUG):
+        # Only for the log line; a body that is not JSON is passed through as-is
+        try:
+            failures = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            failures = None
+        failure_count = len(failures) if isinstance(failures, list) else "unknown"
+        logger.debug("Failures retrieved: count=%s, status=%d", failure_count, response.status_code)
+    return body
+
+
+async def _monitor_metrics(client: httpx.AsyncClient, arguments: dict, endpoints: Endpoints) -> bytes:
+    """Get system metrics and statistics."""
+    period = arguments.get("period", "1h")
+    url = endpoints.monitor_metrics
+    logger.debug("Requesting metrics: url=%s, period=%s", url, period)
+    response = await _call(client, "GET", url, params={"period": period})
+    body = response.content
+    logger.debug("Metrics retrieved: period=%s, status=%d", period, response.status_code)
+    return body
+
+
+async def _monitor_snapshot(run: "ToolRunner", arguments: dict) -> bytes:
+    """Get health, stream status and recent failures, fetching them concurrently."""
+    health, stream, failures = await asyncio.gather(
+        run("monitor_health", {}),
+        run("monitor_stream_status", {}),
+        run("monitor_failures", {"limit": arguments.get("limit", 10)}),
+    )
+    return orjson.dumps({
+        "health": _embed(health),
+        "stream": _embed(stream),
+        "failures": _embed(failures),
+    })
+
+
+async def _monitor_dashboard(run: "ToolRunner", arguments: dict) -> bytes:
+    """Get health, stream status and metrics, fetching them concurrently."""
+    health, stream, metrics = await asyncio.gather(
+        run("monitor_health", {}),
+        run("monitor_stream_status", {}),
+        run("monitor_metrics", {"period": arguments.get("period", "1h")}),
+    )
+    return orjson.dumps({
+        "health": _embed(health),
+        "stream": _embed(stream),
+        "metrics": _embed(metrics),
+    })
+
+
+ToolHandler = Callable[[httpx.AsyncClient, dict, Endpoints], Awaitable[bytes]]
+
+# Runs another tool by name, through its cache and backpressure settings
+ToolRunner = Callable[[str, dict], Awaitable[bytes]]
+
+# Composite tools combine other tools' results instead of calling a service
+CompositeHandler = Callable[[ToolRunner, dict], Awaitable[bytes]]
+
+
+@dataclass(frozen=True, slots=True)
+class HandlerSpec:
+    """Dispatch record for a tool, built once per server.
+
+    ``service`` names the backend the tool calls, for the per-service
+    concurrency limit. ``cache_ttl`` is set for read-only tools: their
+    responses are cached for that many seconds, and concurrent identical
+    calls share one request. A ``cache_ttl`` of zero only does the latter.
+    ``composite`` tools get a ``ToolRunner`` instead of a client, so the
+    tools they combine keep their own caching and concurrency limits.
+    """
+
+    handler: ToolHandler | CompositeHandler
+    service: str
+    cache_ttl: float | None = None
+    composite: bool = False
+
+
+def _build_specs(config: Config) -> dict[str, HandlerSpec]:
+    """Build the tool name -> spec table, so dispatch needs a single dict lookup."""
+    cache = config.cache
+    bulk_status = partial(
+        _dispatcher_bulk_status, max_concurrency=config.backpressure.max_in_flight_per_service
+    )
+    return {
+        "audio_identify": HandlerSpec(_audio_identify, "audio_id"),
+        "audio_status": HandlerSpec(_audio_status, "audio_id"),
+        "image_optimize": HandlerSpec(_image_optimize, "image_opt"),
+        "image_info": HandlerSpec(_image_info, "image_opt", 0.0),
+        "image_optimize_batch": HandlerSpec(_image_optimize_batch, "image_opt"),
+        "image_optimize_async": HandlerSpec(_image_optimize_async, "image_opt"),
+        "image_job_status": HandlerSpec(_image_job_status, "image_opt"),
+        "overlay_create": HandlerSpec(_overlay_create, "overlay"),
+        "overlay_list_templates": HandlerSpec(_overlay_list_templates, "overlay", cache.templates_ttl_seconds),
+        "overlay_preview": HandlerSpec(_overlay_preview, "overlay", cache.preview_ttl_seconds),
+        "dispatcher_enqueue": HandlerSpec(_dispatcher_enqueue, "dispatcher"),
+        "dispatcher_queue_status": HandlerSpec(_dispatcher_queue_status, "dispatcher", cache.ttl_seconds),
+        "dispatcher_job_status": HandlerSpec(_dispatcher_job_status, "dispatcher"),
+        "dispatcher_cancel": HandlerSpec(_dispatcher_cancel, "dispatcher"),
+        "dispatcher_bulk_status": HandlerSpec(bulk_status, "dispatcher"),
+        "monitor_health": HandlerSpec(_monitor_health, "monitor", cache.ttl_seconds),
+        "monitor_stream_status": HandlerSpec(_monitor_stream_status, "monitor", cache.ttl_seconds),
+        "monitor_failures": HandlerSpec(_monitor_failures, "monitor"),
+        "monitor_metrics": HandlerSpec(_monitor_metrics, "monitor", 0.0),
+        "monitor_snapshot": HandlerSpec(_monitor_snapshot, "monitor", composite=True),
+        "monitor_dashboard": HandlerSpec(_monitor_dashboard, "monitor", composite=True),
+    }
+
+
+async def _execute_tool(
+    name: str,
+    spec: HandlerSpec,
+    arguments: dict,
+    endpoints: Endpoints,
+    client: httpx.AsyncClient,
+    cache: ResponseCache,
+    backpressure: Backpressure,
+) -> bytes:
+    """Execute a tool and return the result.
+
+    Calls to the services go through ``backpressure``, so only calls that
+    miss the cache wait for a free slot.
+    """
+    fetch = partial(backpressure.run, spec.service, partial(spec.handler, client, arguments, endpoints))
+    if spec.cache_ttl is not None:
+        try:
+            encoded = orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Integers beyond 64 bits cannot be keyed; such calls skip the cache
+            return await fetch()
+        # Keyed by a digest, so large arguments (overlay preview data) are not kept
+        key = (name, hashlib.blake2b(encoded, digest_size=16).digest())
+        return await cache.get(key, fetch, spec.cache_ttl)
+    return await fetch()
 
 
 async def main() -> None:
     """Run the MCP server."""
     config = load_config()
     
-    # Setup logging from config
+    # Setup logging from config. The format only uses time, name, level and
+    # message, so skip collecting caller, thread and process info per record.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
     log_level = getattr(logging, config.log_level.upper(), logging.INFO)
     logging.basicConfig(
         level=log_level,
@@ -513,17 +790,39 @@ async def main() -> None:
                config.services.audio_id_url, config.services.image_opt_url, config.services.overlay_url,
                config.services.dispatcher_url, config.services.monitor_url)
 
-    server = create_server(config)
-    logger.debug("MCP server created and configured")
-
-    async with stdio_server() as (read_stream, write_stream):
-        logger.info("Starting stdio server for MCP communication")
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    http_client = config.http_client
+    logger.info("HTTP client pool per service: max_connections=%d, max_keepalive_connections=%d, keepalive_expiry=%.1fs, http2=%s",
+               http_client.max_connections, http_client.max_keepalive_connections,
+               http_client.keepalive_expiry, http_client.http2)
+    logger.info("Backpressure: max_in_flight=%d, max_in_flight_per_service=%d",
+               config.backpressure.max_in_flight, config.backpressure.max_in_flight_per_service)
+
+    limits = httpx.Limits(
+        max_connections=http_client.max_connections,
+        max_keepalive_connections=http_client.max_keepalive_connections,
+        keepalive_expiry=http_client.keepalive_expiry,
+    )
+    async with contextlib.AsyncExitStack() as stack:
+        clients = {
+            service: await stack.enter_async_context(
+                httpx.AsyncClient(timeout=_TIMEOUT, limits=limits, http2=http_client.http2)
+            )
+            for service in _SERVICES
+        }
+        server = create_server(config, clients)
+        # Built once up front so the capability structures are not rebuilt per connection
+        init_options = server.create_initialization_options()
+        logger.debug("MCP server created and configured")
+
+        async with stdio_server() as (read_stream, write_stream):
+            logger.info("Starting stdio server for MCP communication")
+            await server.run(read_stream, write_stream, init_options)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,7 +1,8 @@
 # MCP tools for home-display-agent
 #
-# This package contains tool implementations for wrapping external services.
-# Tools are registered centrally in src/main.py to avoid decorator conflicts.
+# This package contains tool definitions for wrapping external services.
+# Each module exports its input schemas and a list of Tool definitions; the
+# tools are registered centrally in src/main.py to avoid decorator conflicts.
 #
 # Available tool modules:
 # - audio_id: Audio identification service tools
@@ -9,7 +9,9 @@ Tools:
 These tools communicate with the audio-id service via HTTP.
 """
 
-# Tool schemas for reference (registered in src/main.py)
+from mcp.types import Tool
+
+# Tool schemas
 AUDIO_IDENTIFY_SCHEMA = {
     "type": "object",
     "properties": {
@@ -36,3 +38,17 @@ AUDIO_STATUS_SCHEMA = {
     },
     "required": ["job_id"],
 }
+
+# Tool definitions (registered in src/main.py)
+AUDIO_ID_TOOLS: list[Tool] = [
+    Tool(
+        name="audio_identify",
+        description="Identify audio content from a file or stream",
+        inputSchema=AUDIO_IDENTIFY_SCHEMA,
+    ),
+    Tool(
+        name="audio_status",
+        description="Get the status of an audio identification job",
+        inputSchema=AUDIO_STATUS_SCHEMA,
+    ),
+]
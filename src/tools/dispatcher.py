@@ -7,11 +7,14 @@ Tools:
     dispatcher_queue_status: Get the current queue status
     dispatcher_job_status: Get the status of a specific job
     dispatcher_cancel: Cancel a pending or running job
+    dispatcher_bulk_status: Get the status of several jobs in one call
 
 These tools communicate with the dispatcher service via HTTP.
 """
 
-# Tool schemas for reference (registered in src/main.py)
+from mcp.types import Tool
+
+# Tool schemas
 DISPATCHER_ENQUEUE_SCHEMA = {
     "type": "object",
     "properties": {
@@ -63,3 +66,46 @@ DISPATCHER_CANCEL_SCHEMA = {
     },
     "required": ["job_id"],
 }
+
+DISPATCHER_BULK_STATUS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "job_ids": {
+            "type": "array",
+            "description": "The job IDs to check",
+            "items": {"type": "string"},
+            "minItems": 1,
+            "maxItems": 100,
+        },
+    },
+    "required": ["job_ids"],
+}
+
+# Tool definitions (registered in src/main.py)
+DISPATCHER_TOOLS: list[Tool] = [
+    Tool(
+        name="dispatcher_enqueue",
+        description="Enqueue a display job for processing",
+        inputSchema=DISPATCHER_ENQUEUE_SCHEMA,
+    ),
+    Tool(
+        name="dispatcher_queue_status",
+        description="Get the current queue status",
+        inputSchema=DISPATCHER_QUEUE_STATUS_SCHEMA,
+    ),
+    Tool(
+        name="dispatcher_job_status",
+        description="Get the status of a specific job",
+        inputSchema=DISPATCHER_JOB_STATUS_SCHEMA,
+    ),
+    Tool(
+        name="dispatcher_cancel",
+        description="Cancel a pending or running job",
+        inputSchema=DISPATCHER_CANCEL_SCHEMA,
+    ),
+    Tool(
+        name="dispatcher_bulk_status",
+        description="Get the status of several jobs in one call",
+        inputSchema=DISPATCHER_BULK_STATUS_SCHEMA,
+    ),
+]
@@ -5,12 +5,18 @@ This module provides tools for optimizing images.
 Tools:
     image_optimize: Optimize an image for display
     image_info: Get metadata and info about an image
+    image_optimize_batch: Optimize several images in one request
+    image_optimize_async: Start optimizing an image in the background
+    image_job_status: Get the status of a background image optimization job
 
 These tools communicate with the image-opt service via HTTP.
 """
 
-# Tool schemas for reference (registered in src/main.py)
-IMAGE_OPTIMIZE_SCHEMA = {
+from mcp.types import Tool
+
+# Tool schemas
+# Per-image options, shared by image_optimize and the items of image_optimize_batch
+_IMAGE_OPTIONS_SCHEMA = {
     "type": "object",
     "properties": {
         "source": {
@@ -40,6 +46,18 @@ IMAGE_OPTIMIZE_SCHEMA = {
     "required": ["source"],
 }
 
+IMAGE_OPTIMIZE_SCHEMA = {
+    **_IMAGE_OPTIONS_SCHEMA,
+    "properties": {
+        **_IMAGE_OPTIONS_SCHEMA["properties"],
+        "raw": {
+            "type": "boolean",
+            "description": "Return the optimized image itself, base64-encoded, instead of the service's JSON response",
+            "default": False,
+        },
+    },
+}
+
 IMAGE_INFO_SCHEMA = {
     "type": "object",
     "properties": {
@@ -50,3 +68,56 @@ IMAGE_INFO_SCHEMA = {
     },
     "required": ["source"],
 }
+
+IMAGE_OPTIMIZE_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "description": "The images to optimize, each with the same options as image_optimize",
+            "items": _IMAGE_OPTIONS_SCHEMA,
+            "minItems": 1,
+        },
+    },
+    "required": ["items"],
+}
+
+IMAGE_JOB_STATUS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "job_id": {
+            "type": "string",
+            "description": "The job ID to check",
+        },
+    },
+    "required": ["job_id"],
+}
+
+# Tool definitions (registered in src/main.py)
+IMAGE_OPT_TOOLS: list[Tool] = [
+    Tool(
+        name="image_optimize",
+        description="Optimize an image for display",
+        inputSchema=IMAGE_OPTIMIZE_SCHEMA,
+    ),
+    Tool(
+        name="image_info",
+        description="Get metadata and info about an image",
+        inputSchema=IMAGE_INFO_SCHEMA,
+    ),
+    Tool(
+        name="image_optimize_batch",
+        description="Optimize several images for display in one request",
+        inputSchema=IMAGE_OPTIMIZE_BATCH_SCHEMA,
+    ),
+    Tool(
+        name="image_optimize_async",
+        description="Start optimizing an image in the background and return a job ID to poll with image_job_status",
+        inputSchema=_IMAGE_OPTIONS_SCHEMA,
+    ),
+    Tool(
+        name="image_job_status",
+        description="Get the status of a background image optimization job",
+        inputSchema=IMAGE_JOB_STATUS_SCHEMA,
+    ),
+]
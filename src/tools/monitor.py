@@ -7,14 +7,24 @@ Tools:
     monitor_stream_status: Get the current stream/display status
     monitor_failures: Get recent failures and errors
     monitor_metrics: Get system metrics and statistics
+    monitor_snapshot: Get health, stream status and recent failures in one call
+    monitor_dashboard: Get health, stream status and metrics in one call
 
 These tools communicate with the monitor service via HTTP.
 """
 
-# Tool schemas for reference (registered in src/main.py)
+from mcp.types import Tool
+
+# Tool schemas
 MONITOR_HEALTH_SCHEMA = {
     "type": "object",
-    "properties": {},
+    "properties": {
+        "probe_services": {
+            "type": "boolean",
+            "description": "Also probe each service's /health endpoint directly",
+            "default": False,
+        },
+    },
 }
 
 MONITOR_STREAM_STATUS_SCHEMA = {
@@ -48,3 +58,60 @@ MONITOR_METRICS_SCHEMA = {
         },
     },
 }
+
+MONITOR_SNAPSHOT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of failures to return",
+            "default": 10,
+        },
+    },
+}
+
+MONITOR_DASHBOARD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "period": {
+            "type": "string",
+            "description": "Time period for metrics",
+            "enum": ["1h", "6h", "24h", "7d"],
+            "default": "1h",
+        },
+    },
+}
+
+# Tool definitions (registered in src/main.py)
+MONITOR_TOOLS: list[Tool] = [
+    Tool(
+        name="monitor_health",
+        description="Check the health status of all services",
+        inputSchema=MONITOR_HEALTH_SCHEMA,
+    ),
+    Tool(
+        name="monitor_stream_status",
+        description="Get the current stream/display status",
+        inputSchema=MONITOR_STREAM_STATUS_SCHEMA,
+    ),
+    Tool(
+        name="monitor_failures",
+        description="Get recent failures and errors",
+        inputSchema=MONITOR_FAILURES_SCHEMA,
+    ),
+    Tool(
+        name="monitor_metrics",
+        description="Get system metrics and statistics",
+        inputSchema=MONITOR_METRICS_SCHEMA,
+    ),
+    Tool(
+        name="monitor_snapshot",
+        description="Get health, stream status and recent failures in one call",
+        inputSchema=MONITOR_SNAPSHOT_SCHEMA,
+    ),
+    Tool(
+        name="monitor_dashboard",
+        description="Get health, stream status and metrics in one call",
+        inputSchema=MONITOR_DASHBOARD_SCHEMA,
+    ),
+]
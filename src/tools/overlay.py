@@ -10,7 +10,9 @@ Tools:
 These tools communicate with the overlay service via HTTP.
 """
 
-# Tool schemas for reference (registered in src/main.py)
+from mcp.types import Tool
+
+# Tool schemas
 OVERLAY_CREATE_SCHEMA = {
     "type": "object",
     "properties": {
@@ -55,3 +57,22 @@ OVERLAY_PREVIEW_SCHEMA = {
     },
     "required": ["template", "data"],
 }
+
+# Tool definitions (registered in src/main.py)
+OVERLAY_TOOLS: list[Tool] = [
+    Tool(
+        name="overlay_create",
+        description="Create an overlay image with text and graphics",
+        inputSchema=OVERLAY_CREATE_SCHEMA,
+    ),
+    Tool(
+        name="overlay_list_templates",
+        description="List available overlay templates",
+        inputSchema=OVERLAY_LIST_TEMPLATES_SCHEMA,
+    ),
+    Tool(
+        name="overlay_preview",
+        description="Generate a preview of an overlay",
+        inputSchema=OVERLAY_PREVIEW_SCHEMA,
+    ),
+]